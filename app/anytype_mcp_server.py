@@ -4,7 +4,6 @@ import os
 from typing import List, Optional
 
 from fastapi import Request
-from fastapi.security.utils import get_authorization_scheme_param
 from mcp.server.fastmcp import FastMCP
 
 from app.clients.anytype import AnytypeClient
@@ -46,6 +45,18 @@ client = AnytypeClient(
 )
 
 
+def _extract_bearer(auth_header: str) -> Optional[str]:
+    """
+    Return the credentials of a "Bearer <token>" header value, or None.
+
+    The scheme is matched case-insensitively with one slice comparison instead
+    of splitting the header.
+    """
+    if auth_header[:7].lower() == "bearer ":
+        return auth_header[7:] or None
+    return None
+
+
 def extract_token_from_request(request: Request) -> Optional[str]:
     """
     Extract Bearer token from Authorization header in the incoming request.
@@ -53,10 +64,7 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     auth_header = request.headers.get("Authorization")
     if not auth_header:
         return None
-    scheme, param = get_authorization_scheme_param(auth_header)
-    if scheme.lower() != "bearer" or not param:
-        return None
-    return param
+    return _extract_bearer(auth_header)
 
 
 @mcp.tool()
@@ -1,23 +1,46 @@
 """Anytype API client implementation"""
 
+import functools
+import inspect
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import (
+    Annotated,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import httpx
+from fastapi import Depends, Request
 
 from app.core.config import settings
 from app.helpers.api import (
     APIError,
+    decode_cursor,
+    encode_cursor,
     get_endpoint,
     make_request,
     prepare_request_data,
     validate_response,
 )
+from app.helpers.cache import MISSING, SingleFlight, TTLCache
 from app.helpers.schemas import (
     ChallengeResponse,
     CreateObjectRequest,
     CreateSpaceRequest,
     CreateTagRequest,
+    CursorPaginatedResponse,
     ExportFormat,
     MemberResponse,
     ObjectExportResponse,
@@ -42,6 +65,96 @@ from app.helpers.schemas import (
 
 logger = logging.getLogger(__name__)
 
+CursorPage = TypeVar("CursorPage", bound=CursorPaginatedResponse)
+AsyncMethod = TypeVar("AsyncMethod", bound=Callable[..., Awaitable[Any]])
+
+# Short-lived cache for single-resource reads. Entries are keyed by token so
+# one caller's results are never served to another.
+_resource_cache = TTLCache(
+    maxsize=settings.anytype_cache_maxsize, ttl=settings.anytype_cache_ttl
+)
+
+# Upstream reads currently in flight, shared by identical concurrent callers
+_inflight_reads = SingleFlight()
+
+# Signatures of the cached_resource reads, by method name, for invalidation
+_resource_signatures: Dict[str, inspect.Signature] = {}
+
+# Generation of each recently invalidated read key. A read only caches its
+# result if the key's generation is unchanged since the read started, so a
+# read that raced an update cannot store the pre-update value. Entries outlive
+# any upstream call, so one is not dropped while a read that predates it runs.
+_resource_generations = TTLCache(maxsize=settings.anytype_cache_maxsize, ttl=300)
+_next_generation = itertools.count(1)
+
+
+def _resource_key(method: str, token: str, *ids: Any) -> Tuple[Hashable, ...]:
+    """Build the cache key for a single-resource read"""
+    return (method, token, *ids)
+
+
+def _read_key(
+    signature: inspect.Signature,
+    method: str,
+    client: "AnytypeClient",
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Tuple[Hashable, ...]:
+    """Build the key of a read from its bound arguments and resolved token"""
+    bound = signature.bind(client, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    del arguments["self"]
+    token = client._get_token(arguments.pop("token"))
+    return _resource_key(method, token, *arguments.values())
+
+
+def coalesced(func: AsyncMethod) -> AsyncMethod:
+    """Share one upstream call between concurrent identical reads per token"""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: "AnytypeClient", *args: Any, **kwargs: Any) -> Any:
+        key = _read_key(signature, func.__name__, self, args, kwargs)
+        return await _inflight_reads.do(key, lambda: func(self, *args, **kwargs))
+
+    return cast(AsyncMethod, wrapper)
+
+
+def cached_resource(func: AsyncMethod) -> AsyncMethod:
+    """Cache an AnytypeClient single-resource read per token and resource IDs
+
+    Concurrent misses for the same key share one upstream call.
+    """
+    signature = _resource_signatures[func.__name__] = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: "AnytypeClient", *args: Any, **kwargs: Any) -> Any:
+        key = _read_key(signature, func.__name__, self, args, kwargs)
+        result = _resource_cache.get(key)
+        if result is MISSING:
+            generation = _resource_generations.get(key)
+            result = await _inflight_reads.do(key, lambda: func(self, *args, **kwargs))
+            if _resource_generations.get(key) == generation:
+                _resource_cache.set(key, result)
+        return result
+
+    return cast(AsyncMethod, wrapper)
+
+
+def invalidate_resource(
+    method: str, client: "AnytypeClient", *args: Any, **kwargs: Any
+) -> None:
+    """Drop a cached_resource read, given the arguments the read was called with
+
+    Reads already in flight for it are no longer shared with later callers and
+    do not cache their result.
+    """
+    key = _read_key(_resource_signatures[method], method, client, args, kwargs)
+    _resource_generations.set(key, next(_next_generation))
+    _inflight_reads.forget(key)
+    _resource_cache.invalidate(key)
+
 
 class AnytypeClient:
     """Anytype API client with improved dependency injection"""
@@ -50,9 +163,11 @@ class AnytypeClient:
         self,
         base_url: str = str(settings.anytype_api_url),
         api_key: str = settings.anytype_api_key,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.base_url = base_url
         self.api_key = api_key
+        self.http_client = http_client
         self.headers = {"Content-Type": "application/json"}
         self.app_name: Optional[str] = None
         self.challenge_id: Optional[str] = None
@@ -72,6 +187,7 @@ class AnytypeClient:
                 headers=self._get_headers(),
                 data={"query": "", "types": [], "sort": SortOptions().dict()},
                 token=token,
+                client=self.http_client,
             )
             return True
         except APIError as e:
@@ -92,6 +208,7 @@ class AnytypeClient:
             str(self.base_url),
             data=data,
             headers=headers,
+            client=self.http_client,
         )
         # The API returns a ChallengeResponse structure directly
         return ChallengeResponse(**result)
@@ -106,6 +223,7 @@ class AnytypeClient:
             str(self.base_url),
             data=data,
             headers=headers,
+            client=self.http_client,
         )
         # The API returns a TokenResponse structure directly
         return TokenResponse(**result)
@@ -123,16 +241,22 @@ class AnytypeClient:
             data=data,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a SpaceResponse structure directly
         return SpaceResponse(**result)
 
+    @coalesced
     async def get_spaces(
-        self, limit: int = 50, offset: int = 0, token: Optional[str] = None
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        token: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedSpaceResponse:
         """Get list of spaces"""
         headers = self._get_headers()
-        params = {"limit": limit, "offset": offset}
+        params = self._get_page_params(limit, offset, cursor)
         result = await make_request(
             "GET",
             get_endpoint("getSpaces"),
@@ -140,10 +264,12 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
-        return PaginatedSpaceResponse(**result)
+        return self._with_next_cursor(PaginatedSpaceResponse(**result), params)
 
+    @cached_resource
     async def get_space(
         self, space_id: str, token: Optional[str] = None
     ) -> SpaceResponse:
@@ -155,20 +281,23 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a SpaceResponse structure directly
         return SpaceResponse(**result)
 
+    @coalesced
     async def get_members(
         self,
         space_id: str,
         limit: int = 50,
         offset: int = 0,
         token: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedMemberResponse:
         """Get space members"""
         headers = self._get_headers()
-        params = {"limit": limit, "offset": offset}
+        params = self._get_page_params(limit, offset, cursor)
         result = await make_request(
             "GET",
             get_endpoint("getMembers", space_id=space_id),
@@ -176,10 +305,12 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
-        return PaginatedMemberResponse(**result)
+        return self._with_next_cursor(PaginatedMemberResponse(**result), params)
 
+    @cached_resource
     async def get_member(
         self, space_id: str, member_id: str, token: Optional[str] = None
     ) -> MemberResponse:
@@ -191,6 +322,7 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a MemberResponse structure directly
         return MemberResponse(**result)
@@ -208,6 +340,7 @@ class AnytypeClient:
             data=data,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns an ObjectResponse structure directly
         return ObjectResponse(**result)
@@ -223,6 +356,7 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns an ObjectResponse structure directly
         return ObjectResponse(**result)
@@ -248,6 +382,7 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
         return PaginatedObjectResponse(**result)
@@ -268,6 +403,7 @@ class AnytypeClient:
             data=object_ids,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a string response directly
         return result
@@ -288,6 +424,7 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a string response directly
         return result
@@ -310,6 +447,7 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
         return PaginatedViewResponse(**result)
@@ -331,6 +469,7 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
         return PaginatedObjectResponse(**result)
@@ -346,6 +485,7 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns an ObjectResponse structure directly
         return ObjectResponse(**result)
@@ -370,6 +510,7 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
         return PaginatedObjectResponse(**result)
@@ -387,20 +528,23 @@ class AnytypeClient:
             data=data,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
         return PaginatedObjectResponse(**result)
 
+    @coalesced
     async def get_types(
         self,
         space_id: str,
         limit: int = 50,
         offset: int = 0,
         token: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedTypeResponse:
         """Get object types"""
         headers = self._get_headers()
-        params = {"limit": limit, "offset": offset}
+        params = self._get_page_params(limit, offset, cursor)
         result = await make_request(
             "GET",
             get_endpoint("getTypes", space_id=space_id),
@@ -408,10 +552,12 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
-        return PaginatedTypeResponse(**result)
+        return self._with_next_cursor(PaginatedTypeResponse(**result), params)
 
+    @cached_resource
     async def get_type(
         self, space_id: str, type_id: str, token: Optional[str] = None
     ) -> TypeResponse:
@@ -423,10 +569,12 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a TypeResponse structure directly
         return TypeResponse(**result)
 
+    @coalesced
     async def get_templates(
         self,
         space_id: str,
@@ -434,10 +582,11 @@ class AnytypeClient:
         limit: int = 50,
         offset: int = 0,
         token: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedTemplateResponse:
         """Get templates"""
         headers = self._get_headers()
-        params = {"limit": limit, "offset": offset}
+        params = self._get_page_params(limit, offset, cursor)
         result = await make_request(
             "GET",
             get_endpoint("getTemplates", space_id=space_id, type_id=type_id),
@@ -445,10 +594,12 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
-        return PaginatedTemplateResponse(**result)
+        return self._with_next_cursor(PaginatedTemplateResponse(**result), params)
 
+    @cached_resource
     async def get_template(
         self, space_id: str, type_id: str, template_id: str, token: Optional[str] = None
     ) -> TemplateResponse:
@@ -465,6 +616,7 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a TemplateResponse structure directly
         return TemplateResponse(**result)
@@ -489,10 +641,12 @@ class AnytypeClient:
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns an ObjectExportResponse structure directly
         return ObjectExportResponse(**result)
 
+    @coalesced
     async def get_tags(
         self,
         space_id: str,
@@ -500,10 +654,11 @@ class AnytypeClient:
         limit: int = 50,
         offset: int = 0,
         token: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> PaginatedTagResponse:
         """Get tags for a property"""
         headers = self._get_headers()
-        params = {"limit": limit, "offset": offset}
+        params = self._get_page_params(limit, offset, cursor)
         result = await make_request(
             "GET",
             get_endpoint("getTags", space_id=space_id, property_id=property_id),
@@ -511,10 +666,12 @@ class AnytypeClient:
             params=params,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a PaginatedResponse structure directly
-        return PaginatedTagResponse(**result)
+        return self._with_next_cursor(PaginatedTagResponse(**result), params)
 
+    @cached_resource
     async def get_tag(
         self, space_id: str, property_id: str, tag_id: str, token: Optional[str] = None
     ) -> TagResponse:
@@ -522,10 +679,13 @@ class AnytypeClient:
         headers = self._get_headers()
         result = await make_request(
             "GET",
-            get_endpoint("getTag", space_id=space_id, property_id=property_id, tag_id=tag_id),
+            get_endpoint(
+                "getTag", space_id=space_id, property_id=property_id, tag_id=tag_id
+            ),
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a TagResponse structure directly
         return TagResponse(**result)
@@ -547,6 +707,7 @@ class AnytypeClient:
             data=data,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
         # The API returns a TagResponse structure directly
         return TagResponse(**result)
@@ -564,12 +725,16 @@ class AnytypeClient:
         headers = self._get_headers()
         result = await make_request(
             "PATCH",
-            get_endpoint("updateTag", space_id=space_id, property_id=property_id, tag_id=tag_id),
+            get_endpoint(
+                "updateTag", space_id=space_id, property_id=property_id, tag_id=tag_id
+            ),
             str(self.base_url),
             data=data,
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
+        invalidate_resource("get_tag", self, space_id, property_id, tag_id, token)
         # The API returns a TagResponse structure directly
         return TagResponse(**result)
 
@@ -580,11 +745,15 @@ class AnytypeClient:
         headers = self._get_headers()
         result = await make_request(
             "DELETE",
-            get_endpoint("deleteTag", space_id=space_id, property_id=property_id, tag_id=tag_id),
+            get_endpoint(
+                "deleteTag", space_id=space_id, property_id=property_id, tag_id=tag_id
+            ),
             str(self.base_url),
             headers=headers,
             token=self._get_token(token),
+            client=self.http_client,
         )
+        invalidate_resource("get_tag", self, space_id, property_id, tag_id, token)
         # The API returns a TagResponse structure directly
         return TagResponse(**result)
 
@@ -599,8 +768,67 @@ class AnytypeClient:
         """Get the token to use for requests"""
         return token or self.api_key
 
-
-# FastAPI dependency
-def get_anytype_client() -> AnytypeClient:
+    def _get_page_params(
+        self, limit: int, offset: int, cursor: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Get pagination query params, resolving an opaque cursor to its offset"""
+        if cursor:
+            offset = decode_cursor(cursor)
+        return {"limit": limit, "offset": offset}
+
+    def _with_next_cursor(self, page: CursorPage, params: Dict[str, int]) -> CursorPage:
+        """Attach the cursor for the page following this one, if there is one"""
+        if page.pagination and page.pagination.has_more:
+            page.next_cursor = encode_cursor(params["offset"] + len(page.data))
+        return page
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all outbound Anytype calls"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.anytype_max_connections,
+            max_keepalive_connections=settings.anytype_max_keepalive_connections,
+        ),
+        http2=settings.anytype_http2,
+    )
+
+
+# FastAPI dependency. Declared async so FastAPI calls it on the event loop
+# instead of dispatching it to the AnyIO thread pool on every request
+async def get_anytype_client(request: Request) -> AnytypeClient:
     """Dependency for getting AnytypeClient instance"""
-    return AnytypeClient()
+    return AnytypeClient(
+        http_client=getattr(request.app.state, "http_client", None),
+    )
+
+
+AnytypeClientFactory = Callable[[], AsyncContextManager[AnytypeClient]]
+
+
+async def get_anytype_client_factory(request: Request) -> AnytypeClientFactory:
+    """Dependency for getting a factory that scopes an AnytypeClient to a block
+
+    Handlers hold the client only for the upstream call, so its connection is
+    back in the pool before the response is serialized. Without a shared pool
+    the block opens its own and closes it on exit.
+    """
+    http_client: Optional[httpx.AsyncClient] = getattr(
+        request.app.state, "http_client", None
+    )
+
+    @asynccontextmanager
+    async def session() -> AsyncIterator[AnytypeClient]:
+        if http_client is not None:
+            yield AnytypeClient(http_client=http_client)
+            return
+        async with create_http_client() as owned_client:
+            yield AnytypeClient(http_client=owned_client)
+
+    return session
+
+
+AnytypeClientDep = Annotated[AnytypeClient, Depends(get_anytype_client)]
+AnytypeClientFactoryDep = Annotated[
+    AnytypeClientFactory, Depends(get_anytype_client_factory)
+]
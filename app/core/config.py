@@ -20,6 +20,18 @@ class Settings(BaseSettings):
         default="http://localhost:31009", alias="ANYTYPE_API_URL"
     )
     anytype_api_key: str = Field(alias="ANYTYPE_API_KEY")
+    anytype_max_connections: int = Field(default=100, alias="ANYTYPE_MAX_CONNECTIONS")
+    anytype_max_keepalive_connections: int = Field(
+        default=50, alias="ANYTYPE_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    anytype_http2: bool = Field(default=True, alias="ANYTYPE_HTTP2")
+    anytype_cache_ttl: float = Field(default=15.0, alias="ANYTYPE_CACHE_TTL")
+    anytype_cache_maxsize: int = Field(default=4096, alias="ANYTYPE_CACHE_MAXSIZE")
+    token_cache_ttl: float = Field(default=60.0, alias="TOKEN_CACHE_TTL")
+    token_cache_maxsize: int = Field(default=1024, alias="TOKEN_CACHE_MAXSIZE")
+    token_cache_negative_ttl: float = Field(
+        default=5.0, alias="TOKEN_CACHE_NEGATIVE_TTL"
+    )
 
     # CORS Configuration
     cors_origins: List[str] = ["*"]
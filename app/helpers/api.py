@@ -1,18 +1,41 @@
 """API helper functions and utilities"""
 
+import asyncio
+import base64
+import binascii
+import functools
 import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypedDict,
+    TypeVar,
+    Union,
+)
 
 import httpx
 from httpx import URL, Headers, QueryParams, Request, Response, Timeout
 
-from .constants import ENDPOINTS, OBJECT_URL_PATTERN
+from .constants import ENDPOINTS, MAX_CONCURRENT_REQUESTS, OBJECT_URL_PATTERN
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bound str.format_map of each endpoint template, built once at import
+_ENDPOINT_FORMATTERS: Dict[str, Callable[[Mapping[str, Any]], str]] = {
+    name: template.format_map for name, template in ENDPOINTS.items()
+}
+
 
 class APIError(Exception):
     """Custom exception for API errors"""
@@ -31,6 +54,7 @@ async def make_request(
     headers: Optional[Dict[str, str]] = None,
     params: Optional[Dict[str, Any]] = None,
     token: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> Dict[str, Any]:
     """Make an HTTP request to the Anytype API
 
@@ -42,6 +66,8 @@ async def make_request(
         headers: Additional headers
         params: Query parameters
         token: Optional Bearer token for authentication
+        client: Shared pooled client to send the request with. A short-lived
+            client is opened for this request alone when omitted.
     """
     base_headers = {
         "Content-Type": "application/json",
@@ -76,69 +102,70 @@ async def make_request(
     )
 
     try:
-        async with httpx.AsyncClient() as client:
-            # Remove trailing slash from base_url and leading slash from endpoint to prevent double slashes
-            base = base_url.rstrip("/")
-            path = endpoint.lstrip("/")
-            url = URL(f"{base}/{path}")
-            timeout = Timeout(30.0)
-            request_headers = Headers(base_headers)
-
-            request_params = {
-                "method": method,
-                "url": url,
-                "headers": request_headers,
-                "timeout": timeout,
-            }
-            if params:
-                request_params["params"] = params
-            if data:
-                request_params["json"] = data
-
-            response: Response = await client.request(**request_params)
-            duration = time.time() - start_time
-
-            if response.status_code == 401:
-                logger.warning(
-                    "Unauthorized API request: %s %s",
-                    method,
-                    endpoint,
-                    extra={"status_code": 401},
-                )
-                logger.warning(f"Response: {response.text}")
-                raise APIError(
-                    "Unauthorized. Please check your authentication token.", 401
-                )
-
-            response.raise_for_status()
-            logger.info(
-                "API request completed: %s %s - %d (%.2fs)",
+        # Remove trailing slash from base_url and leading slash from endpoint to prevent double slashes
+        base = base_url.rstrip("/")
+        path = endpoint.lstrip("/")
+        url = URL(f"{base}/{path}")
+        timeout = Timeout(30.0)
+        request_headers = Headers(base_headers)
+
+        request_params: Dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "headers": request_headers,
+            "timeout": timeout,
+            "params": params or None,
+            "json": data or None,
+        }
+
+        owned = client is None
+        http_client = httpx.AsyncClient() if client is None else client
+        try:
+            response: Response = await http_client.request(**request_params)
+        finally:
+            if owned:
+                await http_client.aclose()
+        duration = time.time() - start_time
+
+        if response.status_code == 401:
+            logger.warning(
+                "Unauthorized API request: %s %s",
                 method,
                 endpoint,
-                response.status_code,
-                duration,
-                extra={
-                    "status_code": response.status_code,
-                    "duration": duration,
-                },
+                extra={"status_code": 401},
             )
+            logger.warning(f"Response: {response.text}")
+            raise APIError("Unauthorized. Please check your authentication token.", 401)
 
-            try:
-                result = response.json()
-                logger.debug("API response data: %s", result)
-                if isinstance(result, dict):
-                    return result
-                return {"data": result}
-            except json.JSONDecodeError:
-                if response.status_code == 204:
-                    logger.debug("Empty response (204 No Content)")
-                    return {}
-                logger.error(
-                    "Invalid JSON response from API: %s",
-                    response.text[:200],
-                    extra={"response_text": response.text},
-                )
-                raise APIError("Invalid JSON response from API", 500) from None
+        response.raise_for_status()
+        logger.info(
+            "API request completed: %s %s - %d (%.2fs)",
+            method,
+            endpoint,
+            response.status_code,
+            duration,
+            extra={
+                "status_code": response.status_code,
+                "duration": duration,
+            },
+        )
+
+        try:
+            result = response.json()
+            logger.debug("API response data: %s", result)
+            if isinstance(result, dict):
+                return result
+            return {"data": result}
+        except json.JSONDecodeError:
+            if response.status_code == 204:
+                logger.debug("Empty response (204 No Content)")
+                return {}
+            logger.error(
+                "Invalid JSON response from API: %s",
+                response.text[:200],
+                extra={"response_text": response.text},
+            )
+            raise APIError("Invalid JSON response from API", 500) from None
 
     except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.WriteTimeout):
         logger.error(
@@ -174,6 +201,7 @@ async def make_request(
         raise APIError(error_msg, status_code) from None
 
 
+@functools.lru_cache(maxsize=8192)
 def construct_object_url(object_id: str, space_id: str) -> str:
     """Construct a URL for an object using the standard pattern"""
     return OBJECT_URL_PATTERN.format(objectId=object_id, spaceId=space_id)
@@ -242,20 +270,22 @@ class RequestData(TypedDict, total=False):
 
 def prepare_request_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare request data by removing None values and formatting"""
+    # Fast path for payloads with every field set, e.g. tag create/update
+    if None not in data.values():
+        return data.copy()
     return {k: v for k, v in data.items() if v is not None}
 
 
+# Bounded because the keys include resource IDs. Errors are raised, not cached
+@functools.lru_cache(maxsize=4096)
 def get_endpoint(name: str, **kwargs: Any) -> str:
     """Get API endpoint by name with parameter substitution"""
-    logger.debug("Getting endpoint: %s with params: %s", name, kwargs)
-    endpoint = ENDPOINTS.get(name)
-    if not endpoint:
+    formatter = _ENDPOINT_FORMATTERS.get(name)
+    if formatter is None:
         logger.error("Unknown endpoint requested: %s", name)
         raise APIError(f"Unknown endpoint: {name}")
     try:
-        formatted_endpoint = endpoint.format(**kwargs)
-        logger.debug("Formatted endpoint: %s", formatted_endpoint)
-        return formatted_endpoint
+        return formatter(kwargs)
     except KeyError as e:
         logger.error(
             "Missing parameter for endpoint %s: %s",
@@ -266,6 +296,51 @@ def get_endpoint(name: str, **kwargs: Any) -> str:
         raise APIError(f"Missing required parameter for endpoint {name}: {e}") from e
 
 
+def encode_cursor(offset: int) -> str:
+    """Encode a pagination position into an opaque cursor string"""
+    payload = json.dumps({"offset": offset}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_cursor back into its offset"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded))["offset"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        logger.warning("Invalid pagination cursor received: %s", cursor)
+        raise APIError("Invalid pagination cursor", 400) from None
+    if type(offset) is not int or offset < 0:
+        logger.warning("Invalid pagination cursor received: %s", cursor)
+        raise APIError("Invalid pagination cursor", 400)
+    return offset
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]], limit: int = MAX_CONCURRENT_REQUESTS
+) -> List[T]:
+    """Await awaitables concurrently with at most limit in flight
+
+    Results are returned in input order, like asyncio.gather. On the first
+    error the unfinished awaitables are cancelled and waited for before it is
+    raised, so none keep running after the caller has moved on.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def get_auth_display_code(
     base_url: str, app_name: str, token: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -0,0 +1,91 @@
+"""In-memory caching utilities"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a time to live"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Get a live entry, or default if it is absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used ones past maxsize"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry if present"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call"""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or wait for the call already running under the same key
+
+        Every caller awaits the shared call through asyncio.shield, so one
+        caller being cancelled does not cancel it for the others.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(call)
+
+    def forget(self, key: Hashable) -> None:
+        """Stop sharing the call running under key, if any
+
+        Callers already waiting on it still get its result; later callers
+        start a new call.
+        """
+        self._calls.pop(key, None)
+
+    def _forget(self, key: Hashable, call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Mark the exception as retrieved in case every caller went away
+            call.exception()
@@ -15,6 +15,7 @@ ENDPOINTS = {
     "getSpace": "/v1/spaces/{space_id}",
     "getSpaces": "/v1/spaces",
     "getMembers": "/v1/spaces/{space_id}/members",
+    "getMember": "/v1/spaces/{space_id}/members/{member_id}",
     # Type operations
     "getTypes": "/v1/spaces/{space_id}/types",
     "getType": "/v1/spaces/{space_id}/types/{type_id}",
@@ -77,6 +78,10 @@ MEMBER_ROLES = {
 # API Limits
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 1000
+MAX_CONCURRENT_REQUESTS = 20  # upstream calls in flight per fanout
+MAX_EXPAND_PAGE_SIZE = 100  # page size cap when each item is fetched in full
+STREAM_PAGE_THRESHOLD = 200  # pages with more items are streamed
+STREAM_CHUNK_SIZE = 100  # items encoded per streamed chunk
 ICON_TIMEOUT = 5000  # milliseconds
 
 # System Types
@@ -0,0 +1,70 @@
+"""HTTP response helpers for router handlers"""
+
+import functools
+from typing import Any, AsyncIterator, List
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from .constants import STREAM_CHUNK_SIZE, STREAM_PAGE_THRESHOLD
+from .schemas import PaginatedResponse
+
+# Encodes a chunk of page items with each item's own model serializer
+_ITEMS_ADAPTER: TypeAdapter[List[Any]] = TypeAdapter(List[Any])
+
+
+def model_response(model: BaseModel) -> ORJSONResponse:
+    """Serialize an already-validated model into a response
+
+    AnytypeClient methods return validated models, so handlers return them
+    through here and FastAPI skips re-validating them against the route's
+    response_model, which is then only used for the OpenAPI schema.
+    """
+    return ORJSONResponse(model.model_dump(mode="json"))
+
+
+async def _iter_page_json(
+    page: PaginatedResponse, adapter: TypeAdapter[Any]
+) -> AsyncIterator[bytes]:
+    """Encode a page as JSON chunk by chunk, keeping the envelope layout"""
+    yield b'{"data":['
+    for start in range(0, len(page.data), STREAM_CHUNK_SIZE):
+        chunk = page.data[start : start + STREAM_CHUNK_SIZE]
+        items = _ITEMS_ADAPTER.dump_json(chunk)
+        yield (b"," if start else b"") + items[1:-1]
+    # Remaining fields (pagination, next_cursor) follow data as in dump_json
+    rest = adapter.dump_json(page, exclude={"data"})
+    yield b"]," + rest[1:] if len(rest) > 2 else b"]}"
+
+
+def page_response(page: PaginatedResponse, adapter: TypeAdapter[Any]) -> Response:
+    """Serialize a paginated model with its adapter, streaming large pages
+
+    Small pages are encoded in one adapter.dump_json call. Large ones are
+    encoded a chunk of items at a time, so the full encoded body is never
+    held in memory and the first bytes are sent before the last items are
+    encoded.
+    """
+    if len(page.data) <= STREAM_PAGE_THRESHOLD:
+        return Response(adapter.dump_json(page), media_type="application/json")
+    return StreamingResponse(
+        _iter_page_json(page, adapter), media_type="application/json"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _error_body(detail: str) -> bytes:
+    return orjson.dumps({"detail": detail})
+
+
+def error_response(status_code: int, detail: str) -> Response:
+    """Build a JSON error response, reusing the encoded body of repeated errors
+
+    Only the body is cached. Middleware such as CORS adds headers to the
+    response object, so every request still gets its own instance.
+    """
+    return Response(
+        _error_body(detail), status_code=status_code, media_type="application/json"
+    )
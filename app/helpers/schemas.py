@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class IconFormat(str, Enum):
@@ -57,10 +57,24 @@ class PaginationMeta(BaseModel):
 class PaginatedResponse(BaseModel):
     """Base paginated response model"""
 
+    model_config = ConfigDict(extra="ignore")
+
     data: List[Any]
     pagination: Optional[PaginationMeta] = None
 
 
+class CursorPaginatedResponse(PaginatedResponse):
+    """Paginated response that also carries an opaque cursor for the next page"""
+
+    next_cursor: Optional[str] = Field(
+        None,
+        description=(
+            "Opaque cursor to pass as `cursor` to fetch the next page, "
+            "null on the last page"
+        ),
+    )
+
+
 class ChallengeResponse(BaseModel):
     """Challenge ID"""
 
@@ -321,19 +335,19 @@ class PaginatedObjectResponse(PaginatedResponse):
     data: List[Object]
 
 
-class PaginatedSpaceResponse(PaginatedResponse):
+class PaginatedSpaceResponse(CursorPaginatedResponse):
     data: List[Space]
 
 
-class PaginatedMemberResponse(PaginatedResponse):
+class PaginatedMemberResponse(CursorPaginatedResponse):
     data: List[Member]
 
 
-class PaginatedTypeResponse(PaginatedResponse):
+class PaginatedTypeResponse(CursorPaginatedResponse):
     data: List[Type]
 
 
-class PaginatedTemplateResponse(PaginatedResponse):
+class PaginatedTemplateResponse(CursorPaginatedResponse):
     data: List[Template]
 
 
@@ -403,5 +417,15 @@ class UpdateTagRequest(BaseModel):
     color: str
 
 
-class PaginatedTagResponse(PaginatedResponse):
+class PaginatedTagResponse(CursorPaginatedResponse):
     data: List[Tag]
+
+
+# Serializers built once at import for the paginated list endpoints, so pages
+# are encoded straight to JSON bytes by pydantic-core
+PAGINATED_OBJECT_ADAPTER = TypeAdapter(PaginatedObjectResponse)
+PAGINATED_SPACE_ADAPTER = TypeAdapter(PaginatedSpaceResponse)
+PAGINATED_MEMBER_ADAPTER = TypeAdapter(PaginatedMemberResponse)
+PAGINATED_TYPE_ADAPTER = TypeAdapter(PaginatedTypeResponse)
+PAGINATED_TEMPLATE_ADAPTER = TypeAdapter(PaginatedTemplateResponse)
+PAGINATED_TAG_ADAPTER = TypeAdapter(PaginatedTagResponse)
@@ -1,7 +1,25 @@
 """String manipulation and formatting utilities"""
 
 import re
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Patterns compiled once at import and shared by the formatters below
+_WHITESPACE = re.compile(r"\s+")
+_SPECIAL_CHARS = re.compile(r"[^\w\s-]")
+_NON_KEY_CHARS = re.compile(r"[^\w_]")
+_URL_SCHEME = re.compile(r"^https?://")
+
+
+def _ascii_deletion_table(pattern: "re.Pattern[str]") -> Dict[int, None]:
+    """Build a str.translate table deleting every ASCII character pattern matches"""
+    return dict.fromkeys(c for c in range(128) if pattern.match(chr(c)))
+
+
+# str.translate equivalents of the character classes above for ASCII input.
+# Non-ASCII input keeps using the regexes, since \w is Unicode-aware.
+_SPECIAL_CHARS_TABLE = _ascii_deletion_table(_SPECIAL_CHARS)
+_NON_KEY_CHARS_TABLE = _ascii_deletion_table(_NON_KEY_CHARS)
 
 
 def pluralize(count: int, singular: str, plural: Optional[str] = None) -> str:
@@ -21,9 +39,9 @@ def format_object_url(object_id: str, space_id: str) -> str:
 def sanitize_query(query: str) -> str:
     """Sanitize search query string"""
     # Remove multiple spaces
-    query = re.sub(r"\s+", " ", query.strip())
+    query = _WHITESPACE.sub(" ", query.strip())
     # Remove special characters that might interfere with search
-    query = re.sub(r"[^\w\s-]", "", query)
+    query = _SPECIAL_CHARS.sub("", query)
     return query
 
 
@@ -31,10 +49,11 @@ def format_snippet(text: str, max_length: int = 150) -> str:
     """Format text snippet with proper length and ellipsis"""
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE.sub(" ", text.strip())
     if len(text) <= max_length:
         return text
-    return text[:max_length].rsplit(" ", 1)[0] + "..."
+    # Leave room for the ellipsis so the snippet stays within max_length
+    return text[: max_length - 3].rsplit(" ", 1)[0] + "..."
 
 
 def format_error_message(error: Any) -> str:
@@ -46,23 +65,29 @@ def format_error_message(error: Any) -> str:
     return str(error)
 
 
-def format_object_name(name: str) -> str:
-    """Format object name according to Anytype conventions"""
+def _titlecase(name: str) -> str:
+    """Format a display name according to Anytype conventions"""
     # Remove leading/trailing whitespace
     name = name.strip()
     # Replace multiple spaces with single space
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE.sub(" ", name)
     # Capitalize first letter of each word
     name = name.title()
     return name
 
 
+# Objects, spaces and templates share the same display name rules
+format_object_name = _titlecase
+format_space_name = _titlecase
+format_template_name = _titlecase
+
+
 def format_type_name(type_name: str) -> str:
     """Format type name according to Anytype conventions"""
     # Remove leading/trailing whitespace
     type_name = type_name.strip()
     # Replace multiple spaces with single space
-    type_name = re.sub(r"\s+", " ", type_name)
+    type_name = _WHITESPACE.sub(" ", type_name)
     # Convert to lowercase
     type_name = type_name.lower()
     # Replace spaces with underscores
@@ -73,10 +98,9 @@ def format_type_name(type_name: str) -> str:
 def format_date(date_str: str) -> str:
     """Format date string for consistent display"""
     try:
-        from datetime import datetime
-
+        # Python 3.10's fromisoformat does not accept the "Z" suffix
         dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return f"{dt:%Y-%m-%d %H:%M:%S}"
     except (ValueError, AttributeError):
         return date_str
 
@@ -86,7 +110,7 @@ def format_source_link(url: str) -> str:
     if not url:
         return ""
     # Ensure URL has proper scheme
-    if not re.match(r"^https?://", url):
+    if not _URL_SCHEME.match(url):
         url = f"https://{url}"
     # Remove trailing slashes
     url = url.rstrip("/")
@@ -103,9 +127,13 @@ def format_member_role(role: str) -> str:
 def format_tag_name(tag: str) -> str:
     """Format tag name according to Anytype conventions"""
     # Remove leading/trailing whitespace and special characters
-    tag = re.sub(r"[^\w\s-]", "", tag.strip())
+    tag = tag.strip()
+    if tag.isascii():
+        tag = tag.translate(_SPECIAL_CHARS_TABLE)
+    else:
+        tag = _SPECIAL_CHARS.sub("", tag)
     # Replace multiple spaces with single space
-    tag = re.sub(r"\s+", " ", tag)
+    tag = _WHITESPACE.sub(" ", tag)
     # Convert to lowercase
     tag = tag.lower()
     # Replace spaces with hyphens
@@ -118,31 +146,12 @@ def format_relation_key(key: str) -> str:
     # Remove leading/trailing whitespace
     key = key.strip()
     # Replace multiple spaces with single space
-    key = re.sub(r"\s+", " ", key)
+    key = _WHITESPACE.sub(" ", key)
     # Convert to lowercase and replace spaces with underscores
     key = key.lower().replace(" ", "_")
     # Remove special characters except underscores
-    key = re.sub(r"[^\w_]", "", key)
+    if key.isascii():
+        key = key.translate(_NON_KEY_CHARS_TABLE)
+    else:
+        key = _NON_KEY_CHARS.sub("", key)
     return key
-
-
-def format_space_name(name: str) -> str:
-    """Format space name according to Anytype conventions"""
-    # Remove leading/trailing whitespace
-    name = name.strip()
-    # Replace multiple spaces with single space
-    name = re.sub(r"\s+", " ", name)
-    # Capitalize first letter of each word
-    name = name.title()
-    return name
-
-
-def format_template_name(name: str) -> str:
-    """Format template name according to Anytype conventions"""
-    # Remove leading/trailing whitespace
-    name = name.strip()
-    # Replace multiple spaces with single space
-    name = re.sub(r"\s+", " ", name)
-    # Capitalize first letter of each word
-    name = name.title()
-    return name
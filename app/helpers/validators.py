@@ -1,6 +1,6 @@
 """Validation utilities"""
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
 
@@ -10,7 +10,8 @@ class TypeValidator:
 
     def __init__(self):
         self._valid_types: Optional[Set[str]] = None
-        self._space_types: Dict[str, Set[str]] = {}
+        # Valid type IDs per (space_id, token); tokens may see different types
+        self._space_types: Dict[Tuple[Optional[str], str], FrozenSet[str]] = {}
 
     async def validate_types(
         self,
@@ -37,7 +38,7 @@ class TypeValidator:
             return None
 
         # Get valid types for the space if not cached
-        cache_key = space_id or "global"
+        cache_key = (space_id, token)
         if cache_key not in self._space_types:
             try:
                 type_list = await client.get_types(
@@ -47,7 +48,7 @@ class TypeValidator:
                     # If no types are returned, don't validate
                     # This handles the case where the space might be new or empty
                     return types
-                self._space_types[cache_key] = {t.id for t in type_list}
+                self._space_types[cache_key] = frozenset(t.id for t in type_list)
             except Exception as e:
                 error_msg = str(e)
                 # Handle both raw error message and wrapped APIError message format
@@ -62,9 +63,9 @@ class TypeValidator:
                 raise
 
         valid_types = self._space_types[cache_key]
-        invalid_types = [t for t in types if t not in valid_types]
-
-        if invalid_types:
+        # One C-level superset check; the invalid list is only built on error
+        if not valid_types.issuperset(types):
+            invalid_types = [t for t in types if t not in valid_types]
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid type(s): {', '.join(invalid_types)}. Valid types are: {', '.join(sorted(valid_types))}",
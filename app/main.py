@@ -1,16 +1,29 @@
 """FastAPI backend for Anytype integration"""
 
 import logging
-from typing import Any, Dict, List, cast
-
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Response, status
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, Dict, List, cast
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 
-from .clients.anytype import AnytypeClient, get_anytype_client
+from .clients.anytype import AnytypeClientDep, create_http_client
 from .core.config import Settings
 from .core.logging import setup_logging
+from .helpers.api import APIError
+from .helpers.cache import MISSING, SingleFlight, TTLCache
+from .helpers.responses import error_response
 
 # Initialize settings and logging
 settings = Settings(_env_file=".env")
@@ -21,11 +34,28 @@ logger = logging.getLogger(__name__)
 logger.info("Starting Anytype API application")
 logger.debug("Using settings: %s", settings.model_dump_json())
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Handle application startup and shutdown events"""
+    # One pooled client for the whole process so outbound Anytype calls reuse
+    # keep-alive connections instead of opening a new one per request
+    async with create_http_client() as http_client:
+        app.state.http_client = http_client
+        logger.info("Application startup complete")
+        logger.info("CORS origins: %s", settings.cors_origins)
+        logger.debug("All routers initialized and ready")
+        yield
+    logger.info("Application shutting down")
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.api_title,
     description=settings.api_description,
     version=settings.api_version,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -38,42 +68,71 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(APIError)
+async def api_error_handler(request: Request, exc: APIError) -> Response:
+    """Translate upstream Anytype API errors raised by any handler into responses"""
+    return error_response(exc.status_code, str(exc))
+
+
 # Security scheme
 oauth2_scheme = HTTPBearer(
     scheme_name="Bearer", description="Bearer token authentication", auto_error=True
 )
 
+# Recent validation results per token. Rejections are kept only briefly so a
+# token that becomes valid upstream is accepted again soon.
+_token_cache = TTLCache(
+    maxsize=settings.token_cache_maxsize, ttl=settings.token_cache_ttl
+)
+
+# Validations in flight, so concurrent first requests with a token share one
+_token_validations = SingleFlight()
+
+_INVALID_TOKEN_DETAIL = "Invalid authentication token"
+# Sent with every 401 from token validation; handlers copy it, never mutate it
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
 
 async def get_validated_token(
+    client: AnytypeClientDep,
     credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    client: AnytypeClient = Depends(get_anytype_client),
 ) -> str:
     """Validate the bearer token and return it if valid"""
     token = credentials.credentials
-    try:
-        is_valid = await client.validate_token(token)
-        if not is_valid:
-            logger.warning("Invalid authentication token attempt")
+    is_valid = _token_cache.get(token)
+    if is_valid is MISSING:
+        try:
+            is_valid = await _token_validations.do(
+                token, lambda: client.validate_token(token)
+            )
+        except Exception as e:
+            # Errors are not cached; the next request retries validation
+            logger.error("Token validation error: %s", str(e))
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+                detail=str(e),
+                headers=_BEARER_CHALLENGE,
+            ) from e
+        ttl = None if is_valid else settings.token_cache_negative_ttl
+        _token_cache.set(token, is_valid, ttl=ttl)
+    if is_valid:
         logger.debug("Token validation successful")
         return token
-    except Exception as e:
-        logger.error("Token validation error: %s", str(e))
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from e
+    logger.warning("Invalid authentication token attempt")
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=_INVALID_TOKEN_DETAIL,
+        headers=_BEARER_CHALLENGE,
+    )
+
+
+ValidatedToken = Annotated[str, Depends(get_validated_token)]
 
 
 # Include routers
 from .routers import auth, objects, spaces, tags, types
 
-# Include routers
+# Register each router exactly once
 routers: List[APIRouter] = [
     cast(APIRouter, auth.router),
     cast(APIRouter, spaces.router),
@@ -94,21 +153,16 @@ async def root() -> Dict[str, str]:
     return {"message": "Welcome to Anytype API"}
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Handle application startup events"""
-    logger.info("Application startup complete")
-    logger.info("CORS origins: %s", settings.cors_origins)
-    logger.debug("All routers initialized and ready")
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Handle application shutdown events"""
-    logger.info("Application shutting down")
-
-
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
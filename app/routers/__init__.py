@@ -1,5 +1,5 @@
 """Router module exports"""
 
-from . import auth, objects, spaces, types
+from . import auth, objects, spaces, tags, types
 
-__all__ = ["auth", "objects", "spaces", "types"]
+__all__ = ["auth", "objects", "spaces", "tags", "types"]
@@ -2,10 +2,10 @@
 
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi import APIRouter, HTTPException, Security
 from fastapi.security.http import HTTPAuthorizationCredentials
 
-from app.clients.anytype import AnytypeClient, get_anytype_client
+from app.clients.anytype import AnytypeClientDep
 from app.helpers.api import APIError
 from app.helpers.schemas import ChallengeResponse, TokenResponse
 from app.main import oauth2_scheme
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/challenge", response_model=ChallengeResponse)
 async def create_challenge(
     app_name: str,
-    client: AnytypeClient = Depends(get_anytype_client),
+    client: AnytypeClientDep,
 ) -> ChallengeResponse:
     """Create authentication challenge (step 1 of new auth flow)"""
     try:
@@ -29,7 +29,7 @@ async def create_challenge(
 async def create_api_key(
     code: str,
     challenge_id: str,
-    client: AnytypeClient = Depends(get_anytype_client),
+    client: AnytypeClientDep,
 ) -> TokenResponse:
     """Create API key using challenge_id and code (step 2 of new auth flow)"""
     try:
@@ -1,11 +1,13 @@
 """Object management router"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from app.clients.anytype import AnytypeClient, get_anytype_client
-from app.helpers.api import APIError
+from app.clients.anytype import AnytypeClientFactoryDep
 from app.helpers.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.helpers.responses import model_response, page_response
 from app.helpers.schemas import (
+    PAGINATED_OBJECT_ADAPTER,
     CreateObjectRequest,
     ExportFormat,
     ObjectExportResponse,
@@ -13,7 +15,7 @@ from app.helpers.schemas import (
     PaginatedObjectResponse,
     SearchRequest,
 )
-from app.main import get_validated_token
+from app.main import ValidatedToken
 
 router = APIRouter(prefix="/spaces/{space_id}/objects", tags=["objects"])
 
@@ -21,58 +23,54 @@ router = APIRouter(prefix="/spaces/{space_id}/objects", tags=["objects"])
 @router.get("", response_model=PaginatedObjectResponse, summary="List objects")
 async def list_objects(
     space_id: str,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedObjectResponse:
+) -> Response:
     """Retrieves a paginated list of objects in the given space."""
-    try:
-        return await client.get_objects(space_id, limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_objects(space_id, limit, offset, token=token)
+    return page_response(result, PAGINATED_OBJECT_ADAPTER)
 
 
 @router.post("", response_model=ObjectResponse, summary="Create object")
 async def create_object(
     space_id: str,
     request: CreateObjectRequest,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> ObjectResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Creates a new object in the specified space using a JSON payload."""
-    try:
-        return await client.create_object(space_id, request, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.create_object(space_id, request, token=token)
+    return model_response(result)
 
 
 @router.get("/{object_id}", response_model=ObjectResponse, summary="Get object")
 async def get_object(
     space_id: str,
     object_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> ObjectResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Fetches the full details of a single object identified by the object ID within the specified space."""
-    try:
-        return await client.get_object(space_id, object_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_object(space_id, object_id, token=token)
+    return model_response(result)
 
 
 @router.delete("/{object_id}", response_model=ObjectResponse, summary="Delete object")
 async def delete_object(
     space_id: str,
     object_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> ObjectResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """This endpoint “deletes” an object by marking it as archived."""
-    try:
-        return await client.delete_object(space_id, object_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.delete_object(space_id, object_id, token=token)
+    return model_response(result)
 
 
 @router.get(
@@ -84,14 +82,13 @@ async def export_object(
     space_id: str,
     object_id: str,
     format: ExportFormat,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> ObjectExportResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """This endpoint exports a single object from the specified space into a desired format."""
-    try:
-        return await client.get_export(space_id, object_id, format, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_export(space_id, object_id, format, token=token)
+    return model_response(result)
 
 
 @router.post(
@@ -102,15 +99,14 @@ async def export_object(
 async def search_objects(
     space_id: str,
     request: SearchRequest,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedObjectResponse:
+) -> Response:
     """This endpoint performs a focused search within a single space."""
-    try:
-        return await client.search_objects(
+    async with client_factory() as client:
+        result = await client.search_objects(
             space_id, request, limit, offset, token=token
         )
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    return page_response(result, PAGINATED_OBJECT_ADAPTER)
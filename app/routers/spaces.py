@@ -1,62 +1,74 @@
 """Space management router"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from app.clients.anytype import AnytypeClient, get_anytype_client
-from app.helpers.api import APIError
-from app.helpers.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.clients.anytype import AnytypeClientFactoryDep
+from app.helpers.api import gather_bounded
+from app.helpers.constants import (
+    DEFAULT_PAGE_SIZE,
+    MAX_EXPAND_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+)
+from app.helpers.responses import model_response, page_response
 from app.helpers.schemas import (
+    PAGINATED_MEMBER_ADAPTER,
+    PAGINATED_SPACE_ADAPTER,
     CreateSpaceRequest,
     MemberResponse,
     PaginatedMemberResponse,
     PaginatedSpaceResponse,
     SpaceResponse,
 )
-from app.main import get_validated_token
+from app.main import ValidatedToken
 
 router = APIRouter(prefix="/spaces", tags=["spaces"])
 
 
-@router.get("", response_model=PaginatedSpaceResponse, summary="List spaces")
+@router.get(
+    "",
+    response_model=PaginatedSpaceResponse,
+    summary="List spaces",
+)
 async def list_spaces(
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedSpaceResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    offset: int = Query(0, ge=0, deprecated=True),
+) -> Response:
     """Retrieves a paginated list of all spaces that are accessible by the authenticated user."""
-    try:
-        return await client.get_spaces(limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_spaces(limit, offset, token=token, cursor=cursor)
+    return page_response(result, PAGINATED_SPACE_ADAPTER)
 
 
 @router.post("", response_model=SpaceResponse, summary="Create space")
 async def create_space(
     request: CreateSpaceRequest,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> SpaceResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Creates a new workspace (or space) based on a supplied name in the JSON request body."""
-    try:
-        return await client.create_space(request, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.create_space(request, token=token)
+    return model_response(result)
 
 
 @router.get("/{space_id}", response_model=SpaceResponse, summary="Get space")
 async def get_space(
     space_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> SpaceResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Fetches full details about a single space identified by its space ID."""
-    try:
-        return await client.get_space(space_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_space(space_id, token=token)
+    return model_response(result)
 
 
 @router.get(
@@ -66,16 +78,40 @@ async def get_space(
 )
 async def list_members(
     space_id: str,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedMemberResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    offset: int = Query(0, ge=0, deprecated=True),
+    expand: bool = Query(
+        False,
+        description=(
+            "Fetch full details for each member; "
+            f"pages are then capped at {MAX_EXPAND_PAGE_SIZE} members"
+        ),
+    ),
+) -> Response:
     """Returns a paginated list of members belonging to the specified space."""
-    try:
-        return await client.get_members(space_id, limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    if expand:
+        # One upstream call per member, so keep expanded pages small
+        limit = min(limit, MAX_EXPAND_PAGE_SIZE)
+    async with client_factory() as client:
+        result = await client.get_members(
+            space_id, limit, offset, token=token, cursor=cursor
+        )
+        if expand:
+            details = await gather_bounded(
+                client.get_member(space_id, member.id, token=token)
+                for member in result.data
+            )
+            # Copy rather than mutate: the page may be shared with concurrent
+            # identical requests
+            result = result.model_copy(
+                update={"data": [detail.member for detail in details]}
+            )
+    return page_response(result, PAGINATED_MEMBER_ADAPTER)
 
 
 @router.get(
@@ -86,11 +122,10 @@ async def list_members(
 async def get_member(
     space_id: str,
     member_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> MemberResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Fetches detailed information about a single member within a space."""
-    try:
-        return await client.get_member(space_id, member_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_member(space_id, member_id, token=token)
+    return model_response(result)
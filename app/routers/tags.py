@@ -1,37 +1,49 @@
 """Tag management router"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
 
-from app.clients.anytype import AnytypeClient, get_anytype_client
-from app.helpers.api import APIError
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
+
+from app.clients.anytype import AnytypeClientFactoryDep
 from app.helpers.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.helpers.responses import model_response, page_response
 from app.helpers.schemas import (
+    PAGINATED_TAG_ADAPTER,
     CreateTagRequest,
     PaginatedTagResponse,
     TagResponse,
     UpdateTagRequest,
 )
-from app.main import get_validated_token
+from app.main import ValidatedToken
 
 router = APIRouter(
     prefix="/spaces/{space_id}/properties/{property_id}/tags", tags=["tags"]
 )
 
 
-@router.get("", response_model=PaginatedTagResponse, summary="List tags")
+@router.get(
+    "",
+    response_model=PaginatedTagResponse,
+    summary="List tags",
+)
 async def list_tags(
     space_id: str,
     property_id: str,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedTagResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    offset: int = Query(0, ge=0, deprecated=True),
+) -> Response:
     """Retrieves a paginated list of tags available for a specific property within a space."""
-    try:
-        return await client.get_tags(space_id, property_id, limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_tags(
+            space_id, property_id, limit, offset, token=token, cursor=cursor
+        )
+    return page_response(result, PAGINATED_TAG_ADAPTER)
 
 
 @router.post("", response_model=TagResponse, summary="Create tag")
@@ -39,14 +51,13 @@ async def create_tag(
     space_id: str,
     property_id: str,
     request: CreateTagRequest,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TagResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Creates a new tag for a given property id in a space."""
-    try:
-        return await client.create_tag(space_id, property_id, request, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.create_tag(space_id, property_id, request, token=token)
+    return model_response(result)
 
 
 @router.get("/{tag_id}", response_model=TagResponse, summary="Get tag")
@@ -54,14 +65,13 @@ async def get_tag(
     space_id: str,
     property_id: str,
     tag_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TagResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Retrieves a tag for a given property id with details like ID, name, and color."""
-    try:
-        return await client.get_tag(space_id, property_id, tag_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_tag(space_id, property_id, tag_id, token=token)
+    return model_response(result)
 
 
 @router.patch("/{tag_id}", response_model=TagResponse, summary="Update tag")
@@ -70,14 +80,15 @@ async def update_tag(
     property_id: str,
     tag_id: str,
     request: UpdateTagRequest,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TagResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Updates a tag for a given property id in a space."""
-    try:
-        return await client.update_tag(space_id, property_id, tag_id, request, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.update_tag(
+            space_id, property_id, tag_id, request, token=token
+        )
+    return model_response(result)
 
 
 @router.delete("/{tag_id}", response_model=TagResponse, summary="Delete tag")
@@ -85,11 +96,10 @@ async def delete_tag(
     space_id: str,
     property_id: str,
     tag_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TagResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Deletes a tag by marking it as archived."""
-    try:
-        return await client.delete_tag(space_id, property_id, tag_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
\ No newline at end of file
+    async with client_factory() as client:
+        result = await client.delete_tag(space_id, property_id, tag_id, token=token)
+    return model_response(result)
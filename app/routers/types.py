@@ -2,49 +2,59 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
 
-from app.clients.anytype import AnytypeClient, get_anytype_client
-from app.helpers.api import APIError
+from app.clients.anytype import AnytypeClientFactoryDep
 from app.helpers.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.helpers.responses import model_response, page_response
 from app.helpers.schemas import (
+    PAGINATED_TEMPLATE_ADAPTER,
+    PAGINATED_TYPE_ADAPTER,
     PaginatedTemplateResponse,
     PaginatedTypeResponse,
     TemplateResponse,
     TypeResponse,
 )
-from app.main import get_validated_token
+from app.main import ValidatedToken
 
 router = APIRouter(prefix="/spaces/{space_id}/types", tags=["types"])
 
 
-@router.get("", response_model=PaginatedTypeResponse, summary="List types")
+@router.get(
+    "",
+    response_model=PaginatedTypeResponse,
+    summary="List types",
+)
 async def list_types(
     space_id: str,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedTypeResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    offset: int = Query(0, ge=0, deprecated=True),
+) -> Response:
     """Retrieves a paginated list of object types available within the specified space."""
-    try:
-        return await client.get_types(space_id, limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_types(
+            space_id, limit, offset, token=token, cursor=cursor
+        )
+    return page_response(result, PAGINATED_TYPE_ADAPTER)
 
 
 @router.get("/{type_id}", response_model=TypeResponse, summary="Get type")
 async def get_type(
     space_id: str,
     type_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TypeResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Fetches detailed information about one specific object type by its ID."""
-    try:
-        return await client.get_type(space_id, type_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_type(space_id, type_id, token=token)
+    return model_response(result)
 
 
 @router.get(
@@ -55,16 +65,20 @@ async def get_type(
 async def list_templates(
     space_id: str,
     type_id: str,
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> PaginatedTemplateResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    offset: int = Query(0, ge=0, deprecated=True),
+) -> Response:
     """Returns a paginated list of templates that are associated with a specific object type within a space."""
-    try:
-        return await client.get_templates(space_id, type_id, limit, offset, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_templates(
+            space_id, type_id, limit, offset, token=token, cursor=cursor
+        )
+    return page_response(result, PAGINATED_TEMPLATE_ADAPTER)
 
 
 @router.get(
@@ -76,11 +90,10 @@ async def get_template(
     space_id: str,
     type_id: str,
     template_id: str,
-    token: str = Depends(get_validated_token),
-    client: AnytypeClient = Depends(get_anytype_client),
-) -> TemplateResponse:
+    token: ValidatedToken,
+    client_factory: AnytypeClientFactoryDep,
+) -> ORJSONResponse:
     """Fetches full details for one template associated with a particular object type in a space."""
-    try:
-        return await client.get_template(space_id, type_id, template_id, token=token)
-    except APIError as e:
-        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
+    async with client_factory() as client:
+        result = await client.get_template(space_id, type_id, template_id, token=token)
+    return model_response(result)
@@ -7,23 +7,17 @@ Makes two POST requests to get a display code, then exchange it for an API key.
 import httpx
 
 
-def create_challenge(base_url, app_name):
+def create_challenge(client, app_name):
     """Step 1: Create a challenge to get display code"""
-    response = httpx.post(
-        f"{base_url}/v1/auth/challenges",
-        json={"app_name": app_name},
-        headers={"Content-Type": "application/json"},
-    )
+    response = client.post("/v1/auth/challenges", json={"app_name": app_name})
     response.raise_for_status()
     return response.json()
 
 
-def create_api_key(base_url, challenge_id, code):
+def create_api_key(client, challenge_id, code):
     """Step 2: Exchange challenge for an API key"""
-    response = httpx.post(
-        f"{base_url}/v1/auth/api_keys",
-        json={"challenge_id": challenge_id, "code": code},
-        headers={"Content-Type": "application/json"},
+    response = client.post(
+        "/v1/auth/api_keys", json={"challenge_id": challenge_id, "code": code}
     )
     response.raise_for_status()
     return response.json()
@@ -36,16 +30,19 @@ def main():
     )
     app_name = input("App name (default: API Client): ").strip() or "API Client"
 
-    # Step 1: Create a challenge
-    print("\nCreating challenge...")
-    challenge = create_challenge(base_url, app_name)
-    challenge_id = challenge["challenge_id"]
-
-    # Step 2: Get an API key
-    print("Getting API key...")
-    code = input("Enter the code from Anytype: ").strip()
-    result = create_api_key(base_url, challenge_id, code)
-    api_key = result["api_key"]
+    # Both steps share one client so the second request reuses the connection.
+    # HTTP/2 is negotiated over TLS; plain http:// URLs stay on HTTP/1.1
+    with httpx.Client(base_url=base_url, http2=True, timeout=10) as client:
+        # Step 1: Create a challenge
+        print("\nCreating challenge...")
+        challenge = create_challenge(client, app_name)
+        challenge_id = challenge["challenge_id"]
+
+        # Step 2: Get an API key
+        print("Getting API key...")
+        code = input("Enter the code from Anytype: ").strip()
+        result = create_api_key(client, challenge_id, code)
+        api_key = result["api_key"]
 
     print(f"\nAPI Key: {api_key}")
     print(f"Export command: export ANYTYPE_API_KEY={api_key}")
@@ -2,17 +2,29 @@
 
 import os
 import sys
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Iterator, Optional
 
+import httpx
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.clients.anytype import AnytypeClient
-from app.core.config import Settings, get_settings
-from app.main import app
+# Settings are read when the app modules below are imported, so the test API
+# key is set once here, before those imports, rather than patched per test.
+# It overrides any real key in the shell and is restored in pytest_unconfigure.
+_session_env = pytest.MonkeyPatch()
+_session_env.setenv("ANYTYPE_API_KEY", "test_api_key")
+
+# The app imports must follow the env setup above, hence the E402 waivers
+from app.clients.anytype import AnytypeClient  # noqa: E402
+from app.core.config import Settings, get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    _session_env.undo()
 
 
 @pytest.fixture(scope="session")
@@ -51,3 +63,36 @@ def anytype_client(test_settings) -> AnytypeClient:
         session_token=test_settings.anytype_session_token,
         app_key=test_settings.anytype_app_key,
     )
+
+
+class MockUpstream:
+    """Routes requests from the shared http_client to the current test's handler"""
+
+    def __init__(self) -> None:
+        self.handler: Optional[Callable[[httpx.Request], httpx.Response]] = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert self.handler is not None, "set upstream.handler in the test first"
+        return self.handler(request)
+
+
+@pytest.fixture(scope="session")
+def _mock_upstream() -> MockUpstream:
+    return MockUpstream()
+
+
+@pytest.fixture
+def upstream(_mock_upstream: MockUpstream) -> Iterator[MockUpstream]:
+    """The shared mock upstream, with its handler cleared after each test"""
+    yield _mock_upstream
+    _mock_upstream.handler = None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client(
+    _mock_upstream: MockUpstream,
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """One MockTransport-backed client reused by every test in the session"""
+    transport = httpx.MockTransport(_mock_upstream)
+    async with httpx.AsyncClient(transport=transport) as client:
+        yield client
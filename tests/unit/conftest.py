@@ -0,0 +1,82 @@
+"""Fixtures shared by the unit tests"""
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import pytest
+
+from app.clients.anytype import _resource_cache
+from app.helpers.schemas import ChallengeResponse, TokenResponse
+
+_CHALLENGE = ChallengeResponse(challenge_id="abc123")
+_TOKEN = TokenResponse(api_key="test_api_key")
+
+
+class _AsyncStub:
+    """Async method stub returning a fixed value and recording its calls"""
+
+    def __init__(self, return_value: Any) -> None:
+        self.default = self.return_value = return_value
+        self.side_effect: Optional[BaseException] = None
+        self.calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        assert self.calls == [(args, kwargs)]
+
+    def reset(self) -> None:
+        self.return_value = self.default
+        self.side_effect = None
+        self.calls.clear()
+
+
+@pytest.fixture(scope="session")
+def _stub_client() -> SimpleNamespace:
+    return SimpleNamespace(
+        create_challenge=_AsyncStub(_CHALLENGE),
+        create_api_key=_AsyncStub(_TOKEN),
+        validate_token=_AsyncStub(True),
+    )
+
+
+@pytest.fixture
+def mock_client(_stub_client: SimpleNamespace) -> Iterator[SimpleNamespace]:
+    """Stand-in for AnytypeClient exposing only the methods auth code calls
+
+    The stub is built once per session; its recorded calls, side effects and
+    overridden return values are reset after each test.
+    """
+    yield _stub_client
+    for stub in vars(_stub_client).values():
+        stub.reset()
+
+
+@pytest.fixture(autouse=True)
+def _clear_resource_cache() -> Iterator[None]:
+    yield
+    _resource_cache.clear()
+
+
+@pytest.fixture
+def calls(
+    upstream, upstream_responses: Callable[[httpx.Request], httpx.Response]
+) -> List[httpx.Request]:
+    """Requests seen by the mock upstream, answered by upstream_responses
+
+    Test modules define an upstream_responses fixture returning the handler
+    for the endpoints they exercise.
+    """
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return upstream_responses(request)
+
+    upstream.handler = handler
+    return seen
@@ -1,6 +1,7 @@
 """Tests for API helper functions"""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from typing import Any, Callable, List
 
 import httpx
 import pytest
@@ -8,6 +9,9 @@ import pytest
 from app.helpers.api import (
     APIError,
     construct_object_url,
+    decode_cursor,
+    encode_cursor,
+    gather_bounded,
     get_endpoint,
     make_request,
     prepare_request_data,
@@ -15,3 +19,124 @@ from app.helpers.api import (
 )
 from app.helpers.constants import ENDPOINTS
 from app.helpers.schemas import SortOptions
+
+
+@pytest.mark.parametrize("offset", [0, 1, 50, 123456])
+def test_cursor_round_trip(offset: int):
+    """Test that a cursor decodes back to the offset it was built from"""
+    cursor = encode_cursor(offset)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == offset
+
+
+@pytest.mark.parametrize(
+    "cursor", ["bad", "", "eyJvZmZzZXQiOi0xfQ", "WzFd", "eyJvZmZzZXQiOnRydWV9"]
+)
+def test_decode_cursor_invalid(cursor: str):
+    """Test that malformed cursors are rejected as a client error"""
+    with pytest.raises(APIError) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+async def test_gather_bounded_limits_concurrency():
+    """Test that results keep input order and in-flight calls stay under limit"""
+    in_flight = 0
+    peak = 0
+
+    async def work(value: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return value * 2
+
+    results = await gather_bounded((work(i) for i in range(10)), limit=3)
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 3
+
+
+async def test_gather_bounded_cancels_the_rest_on_error():
+    """Test that the first error cancels unfinished awaitables before raising"""
+    started: List[int] = []
+    finished: List[int] = []
+
+    async def work(value: int) -> int:
+        started.append(value)
+        if value == 0:
+            raise ValueError("boom")
+        await asyncio.sleep(0.01)
+        finished.append(value)
+        return value
+
+    with pytest.raises(ValueError, match="boom"):
+        await gather_bounded((work(i) for i in range(10)), limit=3)
+    await asyncio.sleep(0.02)
+    assert len(started) < 10
+    assert finished == []
+
+
+def test_get_endpoint():
+    """Test endpoint formatting and errors for unknown names or missing params"""
+    assert get_endpoint("getSpace", space_id="s1") == "/v1/spaces/s1"
+    assert get_endpoint("getSpaces") == ENDPOINTS["getSpaces"]
+    with pytest.raises(APIError, match="Unknown endpoint"):
+        get_endpoint("noSuchEndpoint")
+    with pytest.raises(APIError, match="Missing required parameter"):
+        get_endpoint("getType", space_id="s1")
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({"name": "Tag", "color": "red"}, {"name": "Tag", "color": "red"}),
+        ({"name": "Tag", "icon": None, "tags": []}, {"name": "Tag", "tags": []}),
+        ({"a": None}, {}),
+        ({}, {}),
+    ],
+)
+def test_prepare_request_data(data, expected):
+    """Test that None values are dropped and the input is not returned as-is"""
+    result = prepare_request_data(data)
+    assert result == expected
+    assert result is not data
+
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _respond_with(status_code: int, body: Any = None) -> Handler:
+    """Build a mock upstream handler answering with a canned JSON response"""
+    return lambda request: httpx.Response(status_code, json=body)
+
+
+def _raise_timeout(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("Timeout", request=request)
+
+
+@pytest.mark.parametrize(
+    "handler,expected_status,expected_msg",
+    [
+        (_respond_with(200, {"data": []}), None, None),
+        (_respond_with(401, {"error": "nope"}), 401, "Unauthorized"),
+        (_raise_timeout, 504, "timed out"),
+        (_respond_with(500, {"error": "HTTP Error"}), 500, "HTTP Error"),
+    ],
+    ids=["success", "unauthorized", "timeout", "http_error"],
+)
+async def test_make_request(
+    upstream, http_client, handler, expected_status, expected_msg
+):
+    """Test make_request results and APIError translation of upstream failures"""
+    upstream.handler = handler
+    if expected_status is None:
+        result = await make_request(
+            "GET", "/v1/spaces", "http://test", token="test_token", client=http_client
+        )
+        assert result == {"data": []}
+        return
+    with pytest.raises(APIError) as exc_info:
+        await make_request("GET", "/v1/spaces", "http://test", client=http_client)
+    assert exc_info.value.status_code == expected_status
+    assert expected_msg in str(exc_info.value)
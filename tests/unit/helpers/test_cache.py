@@ -0,0 +1,122 @@
+"""Tests for in-memory caching utilities"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.helpers.cache import MISSING, SingleFlight, TTLCache
+
+
+def test_ttl_cache_get_set():
+    """Test storing and reading back entries, including falsy values"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("missing") is MISSING
+    assert cache.get("missing", None) is None
+
+    cache.set("a", 1)
+    cache.set("b", False)
+    assert cache.get("a") == 1
+    assert cache.get("b") is False
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expiry():
+    """Test that entries expire after their time to live"""
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("app.helpers.cache.time.monotonic", return_value=100.0):
+        cache.set("default", "value")
+        cache.set("short", "value", ttl=1)
+    with patch("app.helpers.cache.time.monotonic", return_value=102.0):
+        assert cache.get("short") is MISSING
+        assert cache.get("default") == "value"
+    with patch("app.helpers.cache.time.monotonic", return_value=105.0):
+        assert cache.get("default") is MISSING
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted past maxsize"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate_and_disable():
+    """Test invalidation and that a zero TTL disables caching"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("unknown")
+    assert cache.get("a") is MISSING
+
+    disabled = TTLCache(maxsize=10, ttl=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is MISSING
+
+
+async def test_single_flight_coalesces_concurrent_calls():
+    """Test that concurrent calls with one key share a single execution"""
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "value"
+
+    results = await asyncio.gather(
+        flight.do("a", fetch), flight.do("a", fetch), flight.do("b", fetch)
+    )
+    assert results == ["value", "value", "value"]
+    assert calls == 2
+    assert len(flight) == 0
+
+
+async def test_single_flight_shares_errors_and_survives_cancellation():
+    """Test that errors reach every caller and one cancellation is isolated"""
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fail() -> None:
+        await release.wait()
+        raise ValueError("boom")
+
+    first = asyncio.ensure_future(flight.do("a", fail))
+    second = asyncio.ensure_future(flight.do("a", fail))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    with pytest.raises(ValueError, match="boom"):
+        await second
+    assert first.cancelled()
+    assert len(flight) == 0
+
+
+async def test_single_flight_forget_starts_a_new_call():
+    """Test that after forget, waiting callers keep the old call and new ones don't"""
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        call = calls
+        await release.wait()
+        return call
+
+    first = asyncio.ensure_future(flight.do("a", fetch))
+    await asyncio.sleep(0)
+    flight.forget("a")
+    second = asyncio.ensure_future(flight.do("a", fetch))
+    await asyncio.sleep(0)
+    release.set()
+    assert (await first, await second) == (1, 2)
+    assert len(flight) == 0
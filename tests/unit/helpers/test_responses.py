@@ -0,0 +1,45 @@
+"""Tests for HTTP response helpers"""
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from app.helpers.constants import STREAM_PAGE_THRESHOLD
+from app.helpers.responses import error_response, page_response
+from app.helpers.schemas import (
+    PAGINATED_TAG_ADAPTER,
+    PaginatedTagResponse,
+    PaginationMeta,
+    Tag,
+)
+
+
+def test_error_response_reuses_body():
+    """Test that repeated errors share the encoded body but not the response"""
+    first = error_response(404, "Object not found")
+    second = error_response(404, "Object not found")
+    assert first.status_code == 404
+    assert first.media_type == "application/json"
+    assert first.body == b'{"detail":"Object not found"}'
+    assert first.body is second.body
+    assert first is not second
+
+
+@pytest.mark.parametrize("size", [0, 3, STREAM_PAGE_THRESHOLD + 150])
+async def test_page_response_matches_adapter_output(size: int):
+    """Test that small pages are rendered directly and large ones streamed"""
+    page = PaginatedTagResponse(
+        data=[Tag(id=f"t{i}", name=f"Tag {i}", color="red") for i in range(size)],
+        pagination=PaginationMeta(has_more=True, limit=500, offset=0, total=size),
+        next_cursor="abc",
+    )
+    response = page_response(page, PAGINATED_TAG_ADAPTER)
+    if size > STREAM_PAGE_THRESHOLD:
+        assert isinstance(response, StreamingResponse)
+        chunks = []
+        async for chunk in response.body_iterator:
+            assert isinstance(chunk, bytes)
+            chunks.append(chunk)
+        body = b"".join(chunks)
+    else:
+        body = response.body
+    assert body == PAGINATED_TAG_ADAPTER.dump_json(page)
@@ -1,7 +1,7 @@
 """Tests for string formatting utilities"""
 
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import pytest
 
@@ -90,6 +90,14 @@ def test_format_snippet(text: str, max_length: Optional[int], expected: str):
         assert result.endswith("...")
 
 
+@pytest.mark.parametrize("max_length", [10, 20, 150])
+def test_format_snippet_stays_within_max_length(max_length: int):
+    """Test that truncated snippets, ellipsis included, fit within max_length"""
+    result = format_snippet("word " * 100, max_length)
+    assert result.endswith("...")
+    assert len(result) <= max_length
+
+
 @pytest.mark.parametrize(
     "error,expected",
     [
@@ -107,6 +115,11 @@ def test_format_error_message(
     assert format_error_message(error) == expected
 
 
+@pytest.mark.parametrize(
+    "formatter",
+    [format_object_name, format_space_name, format_template_name],
+    ids=["object", "space", "template"],
+)
 @pytest.mark.parametrize(
     "name,expected",
     [
@@ -117,9 +130,9 @@ def test_format_error_message(
         ("   ", ""),
     ],
 )
-def test_format_object_name(name: str, expected: str):
-    """Test object name formatting"""
-    assert format_object_name(name) == expected
+def test_format_display_name(formatter: Callable[[str], str], name: str, expected: str):
+    """Test object, space and template name formatting"""
+    assert formatter(name) == expected
 
 
 @pytest.mark.parametrize(
@@ -186,6 +199,7 @@ def test_format_member_role(role: str, expected: str):
         ("Hello World", "hello-world"),
         ("  Hello   World  ", "hello-world"),
         ("hello@#$%^&*world", "helloworld"),
+        ("Café Crème!", "café-crème"),
         ("", ""),
         ("   ", ""),
     ],
@@ -202,6 +216,7 @@ def test_format_tag_name(tag: str, expected: str):
         ("  Hello   World  ", "hello_world"),
         ("hello@#$%^&*world", "helloworld"),
         ("hello_world", "hello_world"),
+        ("Größe-Maß", "größemaß"),
         ("", ""),
         ("   ", ""),
     ],
@@ -209,33 +224,3 @@ def test_format_tag_name(tag: str, expected: str):
 def test_format_relation_key(key: str, expected: str):
     """Test relation key formatting"""
     assert format_relation_key(key) == expected
-
-
-@pytest.mark.parametrize(
-    "name,expected",
-    [
-        ("hello world", "Hello World"),
-        ("  hello   world  ", "Hello World"),
-        ("hello", "Hello"),
-        ("", ""),
-        ("   ", ""),
-    ],
-)
-def test_format_space_name(name: str, expected: str):
-    """Test space name formatting"""
-    assert format_space_name(name) == expected
-
-
-@pytest.mark.parametrize(
-    "name,expected",
-    [
-        ("hello world", "Hello World"),
-        ("  hello   world  ", "Hello World"),
-        ("hello", "Hello"),
-        ("", ""),
-        ("   ", ""),
-    ],
-)
-def test_format_template_name(name: str, expected: str):
-    """Test template name formatting"""
-    assert format_template_name(name) == expected
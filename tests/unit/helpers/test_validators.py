@@ -5,23 +5,29 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi import HTTPException
 
-from app.helpers.schemas import TypeDetails
+from app.helpers.schemas import Type
 from app.helpers.validators import TypeValidator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
     client = MagicMock()
     client.get_types = AsyncMock()
     return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client):
+    """Clear recorded calls, return values and side effects between tests"""
+    yield
+    mock_client.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def validator():
     return TypeValidator()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_none(validator, mock_client):
     """Test validation with no types provided"""
     result = await validator.validate_types(None, None, mock_client, "test_token")
@@ -29,7 +35,6 @@ async def test_validate_types_none(validator, mock_client):
     mock_client.get_types.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_empty_list(validator, mock_client):
     """Test validation with empty type list"""
     result = await validator.validate_types([], None, mock_client, "test_token")
@@ -37,12 +42,11 @@ async def test_validate_types_empty_list(validator, mock_client):
     mock_client.get_types.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_global(validator, mock_client):
     """Test validation against global types"""
     mock_types = [
-        TypeDetails(id="type1", name="Type 1"),
-        TypeDetails(id="type2", name="Type 2"),
+        Type(id="type1", key="type1", name="Type 1"),
+        Type(id="type2", key="type2", name="Type 2"),
     ]
     mock_client.get_types.return_value = mock_types
 
@@ -56,12 +60,11 @@ async def test_validate_types_global(validator, mock_client):
     )
 
 
-@pytest.mark.asyncio
 async def test_validate_types_space_specific(validator, mock_client):
     """Test validation against space-specific types"""
     mock_types = [
-        TypeDetails(id="type1", name="Type 1"),
-        TypeDetails(id="type2", name="Type 2"),
+        Type(id="type1", key="type1", name="Type 1"),
+        Type(id="type2", key="type2", name="Type 2"),
     ]
     mock_client.get_types.return_value = mock_types
     space_id = "test_space"
@@ -76,10 +79,9 @@ async def test_validate_types_space_specific(validator, mock_client):
     )
 
 
-@pytest.mark.asyncio
 async def test_validate_types_invalid(validator, mock_client):
     """Test validation with invalid types"""
-    mock_types = [TypeDetails(id="type1", name="Type 1")]
+    mock_types = [Type(id="type1", key="type1", name="Type 1")]
     mock_client.get_types.return_value = mock_types
 
     with pytest.raises(HTTPException) as exc_info:
@@ -92,7 +94,6 @@ async def test_validate_types_invalid(validator, mock_client):
     assert "Valid types are: type1" in str(exc_info.value.detail)
 
 
-@pytest.mark.asyncio
 async def test_validate_types_no_types_returned(validator, mock_client):
     """Test validation when no types are returned"""
     mock_client.get_types.return_value = []
@@ -106,7 +107,6 @@ async def test_validate_types_no_types_returned(validator, mock_client):
     mock_client.get_types.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_type_not_found_error(validator, mock_client):
     """Test validation when type not found error occurs"""
     mock_client.get_types.side_effect = Exception("type not found")
@@ -120,7 +120,6 @@ async def test_validate_types_type_not_found_error(validator, mock_client):
     mock_client.get_types.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_other_error(validator, mock_client):
     """Test validation when other error occurs"""
     mock_client.get_types.side_effect = Exception("Other error")
@@ -132,12 +131,11 @@ async def test_validate_types_other_error(validator, mock_client):
     mock_client.get_types.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_validate_types_caching(validator, mock_client):
     """Test type validation caching"""
     mock_types = [
-        TypeDetails(id="type1", name="Type 1"),
-        TypeDetails(id="type2", name="Type 2"),
+        Type(id="type1", key="type1", name="Type 1"),
+        Type(id="type2", key="type2", name="Type 2"),
     ]
     mock_client.get_types.return_value = mock_types
 
@@ -152,3 +150,7 @@ async def test_validate_types_caching(validator, mock_client):
     # Call with different space_id should fetch new types
     await validator.validate_types(["type1"], "space1", mock_client, "test_token")
     assert mock_client.get_types.call_count == 2
+
+    # Call with a different token should fetch new types
+    await validator.validate_types(["type1"], "space1", mock_client, "other_token")
+    assert mock_client.get_types.call_count == 3
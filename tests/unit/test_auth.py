@@ -1,30 +1,28 @@
 """Tests for authentication functionality"""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from types import SimpleNamespace
+from typing import List
 
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.clients.anytype import AnytypeClient
+from app.core.config import settings
+from app.helpers import cache
 from app.helpers.api import APIError
 from app.helpers.schemas import ChallengeResponse, TokenResponse
+from app.main import _INVALID_TOKEN_DETAIL, _token_cache, get_validated_token
 from app.routers.auth import create_api_key, create_challenge
 
+pytestmark = pytest.mark.unit
 
-@pytest.fixture
-def mock_client():
-    client = MagicMock(spec=AnytypeClient)
-    client.create_challenge = AsyncMock(
-        return_value=ChallengeResponse(challenge_id="abc123")
-    )
-    client.create_api_key = AsyncMock(
-        return_value=TokenResponse(api_key="test_api_key")
-    )
-    return client
+BEARER_TEST = HTTPAuthorizationCredentials(scheme="Bearer", credentials="test_token")
+BEARER_INVALID = HTTPAuthorizationCredentials(
+    scheme="Bearer", credentials="invalid_token"
+)
 
 
-@pytest.mark.asyncio
 async def test_create_challenge_success(mock_client):
     """Test successful challenge creation"""
     app_name = "Test App"
@@ -34,7 +32,6 @@ async def test_create_challenge_success(mock_client):
     mock_client.create_challenge.assert_called_once_with(app_name)
 
 
-@pytest.mark.asyncio
 async def test_create_challenge_error(mock_client):
     """Test challenge creation with API error"""
     mock_client.create_challenge.side_effect = APIError("API Error", 500)
@@ -44,11 +41,10 @@ async def test_create_challenge_error(mock_client):
         await create_challenge(app_name, mock_client)
 
     assert exc_info.value.status_code == 500
-    assert "API Error" in str(exc_info.value.detail)
+    assert exc_info.value.detail == "API Error"
     mock_client.create_challenge.assert_called_once_with(app_name)
 
 
-@pytest.mark.asyncio
 async def test_create_api_key_success(mock_client):
     """Test successful API key creation"""
     code = "123456"
@@ -59,7 +55,6 @@ async def test_create_api_key_success(mock_client):
     mock_client.create_api_key.assert_called_once_with(code, challenge_id)
 
 
-@pytest.mark.asyncio
 async def test_create_api_key_error(mock_client):
     """Test API key creation with API error"""
     mock_client.create_api_key.side_effect = APIError("Invalid code", 400)
@@ -70,5 +65,89 @@ async def test_create_api_key_error(mock_client):
         await create_api_key(code, challenge_id, mock_client)
 
     assert exc_info.value.status_code == 400
-    assert "Invalid code" in str(exc_info.value.detail)
+    assert exc_info.value.detail == "Invalid code"
     mock_client.create_api_key.assert_called_once_with(code, challenge_id)
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    yield
+    _token_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch) -> List[float]:
+    """A settable clock read by the token cache in place of time.monotonic"""
+    now = [0.0]
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+async def test_get_validated_token(mock_client):
+    """Test that an accepted token is returned"""
+    result = await get_validated_token(mock_client, BEARER_TEST)
+    assert result == "test_token"
+    mock_client.validate_token.assert_called_once_with("test_token")
+
+
+async def test_get_validated_token_rejected(mock_client):
+    """Test that a rejected token raises 401"""
+    mock_client.validate_token.return_value = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_validated_token(mock_client, BEARER_INVALID)
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == _INVALID_TOKEN_DETAIL
+    mock_client.validate_token.assert_called_once_with("invalid_token")
+
+
+async def test_get_validated_token_api_error(mock_client):
+    """Test that an upstream error during validation raises 401"""
+    mock_client.validate_token.side_effect = APIError("Upstream unavailable", 503)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_validated_token(mock_client, BEARER_TEST)
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Upstream unavailable"
+    mock_client.validate_token.assert_called_once_with("test_token")
+    assert len(_token_cache) == 0
+
+
+async def test_get_validated_token_caches_accepted_token(mock_client, clock):
+    """Test that an accepted token is not revalidated for TOKEN_CACHE_TTL"""
+    await get_validated_token(mock_client, BEARER_TEST)
+    clock[0] += settings.token_cache_ttl - 1
+    await get_validated_token(mock_client, BEARER_TEST)
+    assert len(mock_client.validate_token.calls) == 1
+
+    clock[0] += 1
+    await get_validated_token(mock_client, BEARER_TEST)
+    assert len(mock_client.validate_token.calls) == 2
+
+
+async def test_get_validated_token_caches_rejected_token(mock_client, clock):
+    """Test that a rejected token is not revalidated for the negative TTL"""
+    mock_client.validate_token.return_value = False
+
+    for elapsed in (0, settings.token_cache_negative_ttl - 1):
+        clock[0] = elapsed
+        with pytest.raises(HTTPException):
+            await get_validated_token(mock_client, BEARER_INVALID)
+    assert len(mock_client.validate_token.calls) == 1
+
+    clock[0] = settings.token_cache_negative_ttl
+    with pytest.raises(HTTPException):
+        await get_validated_token(mock_client, BEARER_INVALID)
+    assert len(mock_client.validate_token.calls) == 2
+
+
+async def test_get_validated_token_shares_concurrent_validation(mock_client):
+    """Test that concurrent first requests with one token validate it once"""
+    results = await asyncio.gather(
+        get_validated_token(mock_client, BEARER_TEST),
+        get_validated_token(mock_client, BEARER_TEST),
+    )
+    assert results == ["test_token", "test_token"]
+    mock_client.validate_token.assert_called_once_with("test_token")
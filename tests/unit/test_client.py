@@ -0,0 +1,112 @@
+"""Tests for AnytypeClient read caching and coalescing"""
+
+import asyncio
+from typing import Callable
+
+import httpx
+import pytest
+
+from app.clients.anytype import AnytypeClient
+from app.helpers.schemas import UpdateTagRequest
+
+_TAG = {"tag": {"id": "tag1", "name": "Urgent", "color": "red"}}
+_TAGS = {"data": [_TAG["tag"]], "pagination": {"has_more": False}}
+
+
+@pytest.fixture
+def client(http_client) -> AnytypeClient:
+    return AnytypeClient(
+        base_url="http://test", api_key="client_key", http_client=http_client
+    )
+
+
+@pytest.fixture
+def upstream_responses() -> Callable[[httpx.Request], httpx.Response]:
+    """Mock upstream handler serving the tag endpoints"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/tags"):
+            return httpx.Response(200, json=_TAGS)
+        return httpx.Response(200, json=_TAG)
+
+    return handler
+
+
+async def test_cached_resource_reads_upstream_once(client, calls):
+    """Test that repeated reads, positional or keyword, share one upstream call"""
+    first = await client.get_tag("space1", "prop1", "tag1")
+    second = await client.get_tag(space_id="space1", property_id="prop1", tag_id="tag1")
+    assert first is second
+    assert len(calls) == 1
+
+    # The default token is the client's API key, so passing it hits the cache
+    await client.get_tag("space1", "prop1", "tag1", token="client_key")
+    assert len(calls) == 1
+
+    await client.get_tag("space1", "prop1", "tag1", token="other_key")
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "mutation, extra_args, method",
+    [
+        ("update_tag", (UpdateTagRequest(name="Done", color="green"),), "PATCH"),
+        ("delete_tag", (), "DELETE"),
+    ],
+    ids=["update_tag", "delete_tag"],
+)
+async def test_tag_mutation_invalidates_cached_read(
+    client, calls, mutation, extra_args, method
+):
+    """Test that a read after updating or deleting a tag refetches it"""
+    await client.get_tag("space1", "prop1", "tag1")
+    await getattr(client, mutation)("space1", "prop1", "tag1", *extra_args)
+    await client.get_tag("space1", "prop1", "tag1")
+
+    assert [request.method for request in calls] == ["GET", method, "GET"]
+
+
+async def test_update_during_in_flight_read_is_not_cached_stale(client, upstream):
+    """Test that a read racing an update neither serves nor caches the old tag"""
+    tag = dict(_TAG["tag"])
+    first_read_started = asyncio.Event()
+    release_first_read = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            tag["name"] = "Done"
+        elif not first_read_started.is_set():
+            snapshot = dict(tag)
+            first_read_started.set()
+            await release_first_read.wait()
+            return httpx.Response(200, json={"tag": snapshot})
+        return httpx.Response(200, json={"tag": tag})
+
+    upstream.handler = handler
+    stale_read = asyncio.ensure_future(client.get_tag("space1", "prop1", "tag1"))
+    await first_read_started.wait()
+    request = UpdateTagRequest(name="Done", color="red")
+    await client.update_tag("space1", "prop1", "tag1", request)
+    fresh_read = asyncio.ensure_future(client.get_tag("space1", "prop1", "tag1"))
+    await asyncio.sleep(0)
+    release_first_read.set()
+
+    assert (await stale_read).tag.name == "Urgent"
+    assert (await fresh_read).tag.name == "Done"
+    later = await client.get_tag("space1", "prop1", "tag1")
+    assert later.tag.name == "Done"
+
+
+async def test_coalesced_reads_share_concurrent_call(client, calls):
+    """Test that concurrent identical list reads make one upstream call"""
+    results = await asyncio.gather(
+        client.get_tags("space1", "prop1"),
+        client.get_tags(space_id="space1", property_id="prop1"),
+        client.get_tags("space1", "prop1", token="other_key"),
+    )
+    assert results[0] is results[1]
+    assert len(calls) == 2
+
+    # Nothing is cached once the shared call completes
+    await client.get_tags("space1", "prop1")
+    assert len(calls) == 3
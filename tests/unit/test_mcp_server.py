@@ -0,0 +1,35 @@
+"""Tests for the MCP server request helpers"""
+
+from typing import Optional
+
+import pytest
+from fastapi import Request
+
+from app.anytype_mcp_server import extract_token_from_request
+
+
+def _request(authorization: Optional[str]) -> Request:
+    headers = (
+        [] if authorization is None else [(b"authorization", authorization.encode())]
+    )
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "authorization,expected",
+    [
+        ("Bearer abc123", "abc123"),
+        ("bEaReR abc123", "abc123"),
+        (None, None),
+        ("", None),
+        ("Basic dXNlcjpwYXNz", None),
+        ("Bearer", None),
+        ("Bearer ", None),
+    ],
+    ids=["bearer", "mixed_case", "missing", "empty", "basic", "no_space", "no_token"],
+)
+def test_extract_token_from_request(
+    authorization: Optional[str], expected: Optional[str]
+):
+    """Test reading the bearer token from the Authorization header"""
+    assert extract_token_from_request(_request(authorization)) == expected
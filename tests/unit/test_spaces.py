@@ -0,0 +1,81 @@
+"""Tests for the spaces routes"""
+
+from typing import AsyncGenerator, Callable
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.helpers.constants import MAX_EXPAND_PAGE_SIZE
+from app.main import app, get_validated_token
+
+_MEMBERS = {
+    "data": [{"id": "m1", "name": "Ann"}, {"id": "m2", "name": "Bob"}],
+    "pagination": {"has_more": False, "limit": 50, "offset": 0, "total": 2},
+}
+
+
+def _member_detail(member_id: str) -> dict:
+    return {"id": member_id, "name": member_id.upper(), "role": "editor"}
+
+
+@pytest_asyncio.fixture
+async def api_client(http_client) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Client for the app, with upstream calls going to the mock upstream"""
+    app.state.http_client = http_client
+    app.dependency_overrides[get_validated_token] = lambda: "test_token"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+    del app.state.http_client
+
+
+@pytest.fixture
+def upstream_responses() -> Callable[[httpx.Request], httpx.Response]:
+    """Mock upstream handler serving the member endpoints"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/members"):
+            return httpx.Response(200, json=_MEMBERS)
+        member_id = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, json={"member": _member_detail(member_id)})
+
+    return handler
+
+
+@pytest.mark.parametrize("expand", [False, True], ids=["summary", "expanded"])
+async def test_list_members(api_client, calls, expand):
+    """Test listing members, optionally expanded with each member's details"""
+    response = await api_client.get(
+        "/spaces/space1/members", params={"expand": str(expand).lower()}
+    )
+
+    assert response.status_code == 200
+    members = response.json()["data"]
+    if expand:
+        assert [(m["id"], m["name"], m["role"]) for m in members] == [
+            ("m1", "M1", "editor"),
+            ("m2", "M2", "editor"),
+        ]
+        assert sorted(request.url.path for request in calls) == [
+            "/v1/spaces/space1/members",
+            "/v1/spaces/space1/members/m1",
+            "/v1/spaces/space1/members/m2",
+        ]
+    else:
+        assert [(m["id"], m["name"], m["role"]) for m in members] == [
+            ("m1", "Ann", None),
+            ("m2", "Bob", None),
+        ]
+        assert len(calls) == 1
+
+
+async def test_list_members_expand_caps_page_size(api_client, calls):
+    """Test that expanded listings request at most MAX_EXPAND_PAGE_SIZE members"""
+    response = await api_client.get(
+        "/spaces/space1/members", params={"expand": "true", "limit": 500}
+    )
+
+    assert response.status_code == 200
+    assert calls[0].url.params["limit"] == str(MAX_EXPAND_PAGE_SIZE)